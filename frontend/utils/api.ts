@@ -4,6 +4,16 @@ import * as FileSystem from 'expo-file-system/legacy';
 // Backend API Configuration
 const API_BASE_URL = 'http://10.46.184.141:8000'; // Local Backend IP
 
+// Known image extensions for MIME type inference (Set for O(1) lookup,
+// built once instead of per upload)
+const IMAGE_EXTENSIONS = new Set(['jpg', 'jpeg', 'png', 'gif']);
+
+// Random suffix for upload filenames - timestamps alone collide when photos
+// are uploaded in parallel within the same millisecond
+function randomSuffix(): string {
+  return Math.random().toString(36).slice(2, 10);
+}
+
 export async function demoLogin() {
   try {
     const response = await fetch(`${API_BASE_URL}/auth/demo-login`, {
@@ -88,7 +98,7 @@ export async function uploadImage(
 
     formData.append('file', {
       uri: imageUri,
-      name: `photo_${Date.now()}.${fileType}`,
+      name: `photo_${Date.now()}_${randomSuffix()}.${fileType}`,
       type: `image/${fileType}`,
     } as any);
 
@@ -168,6 +178,18 @@ export async function imageToBase64(imageUri: string): Promise<string> {
 }
 export async function compareImages(oldImageUri: string, newImageUri: string) {
   try {
+    // Identical inputs can't differ - skip the upload and the backend's
+    // whole pixel-diff pipeline, and answer with a zero-diff result. This
+    // happens when a stage falls back to the current car's photo.
+    if (oldImageUri === newImageUri) {
+      return {
+        diff_image_base64: await imageToBase64(newImageUri),
+        diff_percentage: 0,
+        mse: 0,
+        changes_summary: 'Images are identical - no differences detected.',
+      };
+    }
+
     const formData = new FormData();
 
     const getFileObj = (uri: string, name: string) => {
@@ -207,7 +229,7 @@ export async function uploadFile(fileType: string, fileUri: string) {
 
     // Basic MIME type inference
     let type = 'application/octet-stream';
-    if (['jpg', 'jpeg', 'png', 'gif'].includes(ext.toLowerCase())) type = `image/${ext}`;
+    if (IMAGE_EXTENSIONS.has(ext.toLowerCase())) type = `image/${ext}`;
     else if (ext.toLowerCase() === 'pdf') type = 'application/pdf';
 
     formData.append('file', {
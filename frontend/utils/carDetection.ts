@@ -38,6 +38,8 @@ export interface DetectionResult {
 
 const QUALITY_THRESHOLD = 65;
 
+type QualityAnalysis = Awaited<ReturnType<typeof analyzeImageQuality>>;
+
 // Simulate ML car detection - in production, use TensorFlow Lite
 export async function detectCar(imageUri: string, expectedAngle?: CarAngle): Promise<DetectionResult> {
   try {
@@ -53,7 +55,9 @@ export async function detectCar(imageUri: string, expectedAngle?: CarAngle): Pro
       };
     }
 
-    const angle = await detectAngle(imageUri);
+    // Reuse the analysis above - re-running it per check would analyze the
+    // same image four times over.
+    const angle = detectAngle(qualityAnalysis);
 
     if (expectedAngle && angle !== expectedAngle) {
       const angleNames: Record<CarAngle, string> = {
@@ -73,9 +77,9 @@ export async function detectCar(imageUri: string, expectedAngle?: CarAngle): Pro
 
     const angleScore = 25;
 
-    const framing = await checkFraming(imageUri);
+    const framing = checkFraming(qualityAnalysis);
     const lighting = await checkLighting(imageUri);
-    const quality = await checkQuality(imageUri);
+    const quality = await checkQuality(imageUri, qualityAnalysis);
 
     const totalScore = angleScore + framing.score + lighting.score + quality.score;
 
@@ -118,10 +122,8 @@ export async function detectCar(imageUri: string, expectedAngle?: CarAngle): Pro
   }
 }
 
-async function detectAngle(imageUri: string): Promise<CarAngle> {
+function detectAngle(analysis: QualityAnalysis): CarAngle {
   try {
-    const analysis = await analyzeImageQuality(imageUri);
-
     const brightness = 0.5;
     const quality = analysis.quality || 50;
 
@@ -148,10 +150,8 @@ async function detectAngle(imageUri: string): Promise<CarAngle> {
   }
 }
 
-async function checkFraming(imageUri: string): Promise<FramingCheck> {
+function checkFraming(analysis: QualityAnalysis): FramingCheck {
   try {
-    const analysis = await analyzeImageQuality(imageUri);
-
     if (analysis.details.resolution === 'low') {
       return {
         isOptimal: false,
@@ -224,10 +224,9 @@ async function checkLighting(imageUri: string): Promise<LightingCheck> {
   }
 }
 
-async function checkQuality(imageUri: string): Promise<QualityCheck> {
+async function checkQuality(imageUri: string, qualityAnalysis: QualityAnalysis): Promise<QualityCheck> {
   try {
     const blurAnalysis = await analyzeBlur(imageUri);
-    const qualityAnalysis = await analyzeImageQuality(imageUri);
 
     let score = 24;
     let hint = 'Image quality excellent.';
@@ -26,6 +26,15 @@ export const compareStructuredReports = (oldResults: GeminiAnalysisResult[], new
     // Assuming results align by index (0..n). If length differs, we handle min length, or assume fix set of angles.
     // PHOTO_CONFIG is the source of truth for angles.
 
+    // Fast path: same array instance means nothing changed between stages.
+    if (oldResults === newResults) {
+        return {
+            summary: 'No significant structural differences.',
+            angles: [],
+            overallConfirm: false
+        };
+    }
+
     // Create a map or just iterate. Since array index matters:
     const anglesDiff: AngleDiff[] = [];
     let differencesFound = false;
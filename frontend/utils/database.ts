@@ -6,6 +6,12 @@ let db: SQLite.SQLiteDatabase | null = null;
 // Initialize database
 export async function initDatabase() {
   try {
+    // Reuse the open handle - every screen calls this on mount, and
+    // reopening the database each time pays the connection cost again.
+    if (db) {
+      return true;
+    }
+
     db = await SQLite.openDatabaseAsync('taxi_inspection.db');
     
     await db.execAsync(`
@@ -4,6 +4,20 @@ import { StoredImage } from './types';
 
 const BACKUP_DIR = `${FileSystem.documentDirectory}inspections`;
 
+// Create the backup directory once per session instead of stat-ing it on
+// every export/backup call
+let backupDirReady: Promise<void> | null = null;
+
+function ensureBackupDir(): Promise<void> {
+  if (!backupDirReady) {
+    backupDirReady = FileSystem.makeDirectoryAsync(BACKUP_DIR, { intermediates: true }).catch((error) => {
+      backupDirReady = null;
+      throw error;
+    });
+  }
+  return backupDirReady;
+}
+
 // Export all images as CSV
 export async function exportImagesAsCSV(): Promise<string> {
   try {
@@ -21,13 +35,15 @@ export async function exportImagesAsCSV(): Promise<string> {
       });
     });
 
-    let csv = 'ID,Inspection ID,Image Index,Damage Type,Severity,Timestamp\n';
+    // Collect rows and join once - repeated string concatenation reallocates
+    // the whole CSV for every image
+    const rows = ['ID,Inspection ID,Image Index,Damage Type,Severity,Timestamp'];
     result.forEach((img) => {
       const analysis = JSON.parse(img.damage_analysis || '{}');
-      csv += `${img.id},"${img.inspection_id}",${img.image_index},"${analysis.damageType || 'N/A'}","${analysis.severity || 'N/A'}","${img.timestamp}"\n`;
+      rows.push(`${img.id},"${img.inspection_id}",${img.image_index},"${analysis.damageType || 'N/A'}","${analysis.severity || 'N/A'}","${img.timestamp}"`);
     });
 
-    return csv;
+    return rows.join('\n') + '\n';
   } catch (error) {
     console.error('❌ Error exporting CSV:', error);
     throw error;
@@ -37,7 +53,7 @@ export async function exportImagesAsCSV(): Promise<string> {
 // Save CSV to file
 export async function saveCSVToFile(csvContent: string): Promise<string> {
   try {
-    await FileSystem.makeDirectoryAsync(BACKUP_DIR, { intermediates: true });
+    await ensureBackupDir();
     const timestamp = new Date().toISOString().slice(0, 10);
     const filePath = `${BACKUP_DIR}/inspections_${timestamp}.csv`;
     await FileSystem.writeAsStringAsync(filePath, csvContent);
@@ -109,7 +125,7 @@ export async function backupDatabase(): Promise<string> {
     const dbPath = `${FileSystem.documentDirectory}SQLite/taxi_inspection.db`;
     const backupPath = `${BACKUP_DIR}/taxi_inspection_backup_${Date.now()}.db`;
 
-    await FileSystem.makeDirectoryAsync(BACKUP_DIR, { intermediates: true });
+    await ensureBackupDir();
     await FileSystem.copyAsync({
       from: dbPath,
       to: backupPath
@@ -1,9 +1,13 @@
 import * as FileSystem from 'expo-file-system/legacy';
 
 import { GEMINI_API_KEY } from './config';
+import { compressImage, getImageDimensions } from './imageCompression';
 
 const USE_DEMO_MODE = false;
 
+// Built once - the model and key never change between calls
+const GEMINI_API_URL = `https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash-exp:generateContent?key=${GEMINI_API_KEY}`;
+
 export interface GeminiAnalysisResult {
   hasDamage: boolean;
   damageType: string;
@@ -83,7 +87,23 @@ export async function analyzeCarDamageWithGemini(imageUri: string, expectedAngle
     console.log('Analyzing car image with Gemini AI...');
     console.log('Using configured API Key');
 
-    const base64 = await imageToBase64(imageUri);
+    // Downscale oversized images before encoding - damage detection doesn't
+    // need full camera resolution, and a smaller JPEG means less base64 work
+    // and a much smaller request payload. Photos from the capture flow are
+    // already compressed to 1024px, so check dimensions first and keep the
+    // original URI (no decode/re-encode) when it's within bounds.
+    let uploadUri = imageUri;
+    try {
+      const { width, height } = await getImageDimensions(imageUri);
+      if (width > 1024 || height > 1024) {
+        const compressed = await compressImage(imageUri);
+        uploadUri = compressed.uri;
+      }
+    } catch (e) {
+      console.log('Downscale before analysis failed, using original image:', e);
+    }
+
+    const base64 = await imageToBase64(uploadUri);
 
     const payload = {
       contents: [
@@ -128,10 +148,9 @@ If image is completely blank or corrupted, set hasDamage to false.`,
       ],
     };
 
-    const apiUrl = `https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash-exp:generateContent?key=${GEMINI_API_KEY}`;
     console.log('Calling Gemini API (gemini-2.0-flash-exp)...');
 
-    const response = await fetch(apiUrl, {
+    const response = await fetch(GEMINI_API_URL, {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
@@ -179,11 +198,15 @@ If image is completely blank or corrupted, set hasDamage to false.`,
 export async function analyzeBatchCarDamage(imageUris: string[]): Promise<GeminiAnalysisResult[]> {
   const results: GeminiAnalysisResult[] = [];
 
+  // Resolve the module once - dynamic import (kept to avoid a circular
+  // dependency) doesn't need to be re-awaited for every image.
+  const { PHOTO_CONFIG } = await import('./carDetection');
+
   for (let i = 0; i < imageUris.length; i++) {
     try {
       console.log(`Analyzing image ${i + 1}/${imageUris.length}...`);
 
-      const { label } = await import('./carDetection').then(m => m.PHOTO_CONFIG[i]);
+      const label = PHOTO_CONFIG[i]?.label || 'Car View';
 
       const result = await analyzeCarDamageWithGemini(imageUris[i], label);
       results.push(result);
@@ -98,7 +98,7 @@ export async function compressImage(
 /**
  * Get image dimensions - required for aspect ratio preservation
  */
-async function getImageDimensions(
+export async function getImageDimensions(
   imageUri: string
 ): Promise<{ width: number; height: number }> {
   return new Promise((resolve, reject) => {
@@ -24,11 +24,14 @@ export async function getStoredPhotoSets(): Promise<{
     const allKeys = await AsyncStorage.getAllKeys();
     const photoKeys = allKeys.filter(key => key.startsWith('photos_'));
 
+    // Fetch all photo sets in one batched read instead of a round-trip to
+    // native storage per key
+    const storedEntries = await AsyncStorage.multiGet(photoKeys);
+
     const sets = [];
 
-    for (const key of photoKeys) {
+    for (const [key, storedData] of storedEntries) {
       const carModel = key.replace('photos_', '');
-      const storedData = await AsyncStorage.getItem(key);
 
       if (storedData) {
         const photos = JSON.parse(storedData);